@@ -6,57 +6,169 @@ Web-based Tesla order tracking with automatic browser authentication.
 
 import sys
 import os
-import subprocess
-import time
-from pathlib import Path
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+BANNER = (
+    "🚗" * 30
+    + "\n🚗  TESLA ORDER STATUS TRACKER  🚗"
+    + "\n🚗        Web Interface         🚗"
+    + "\n" + "🚗" * 30
+    + "\n\n"
+)
+
+WELCOME_TEXT = (
+    "Welcome to Tesla Order Status Tracker!\n"
+    "This tool helps you monitor your Tesla order status and delivery updates\n"
+    "through an easy-to-use web interface.\n\n"
+)
+INSTALL_PROMPT = "Would you like to install them now? (y/n): "
+LAUNCH_PROMPT = "🚀 Ready to launch Tesla Order Status Tracker? (y/n): "
+
+_TTY = sys.stdout.isatty()
 
 def print_banner():
     """Print the application banner"""
-    print("🚗" * 30)
-    print("🚗  TESLA ORDER STATUS TRACKER  🚗")
-    print("🚗        Web Interface         🚗") 
-    print("🚗" * 30)
-    print()
+    if _TTY:
+        sys.stdout.write(BANNER)
+    else:
+        # Piped/redirected output gets a plain line instead of emoji art.
+        sys.stdout.write("tesla-order-status launcher starting\n")
+
+def _prompt(text):
+    """Write a prompt in one call and read one line from stdin."""
+    sys.stdout.write(text)
+    sys.stdout.flush()
+    return sys.stdin.readline().strip().lower()
+
+def _deps_sentinel_file():
+    """Path of the sentinel file that marks dependencies as verified."""
+    return os.path.join(SCRIPT_DIR, ".deps_ok")
+
+def _requirements_hash():
+    """Return the sha256 of requirements.txt, or None if it is missing."""
+    import hashlib
+
+    requirements_file = os.path.join(SCRIPT_DIR, "requirements.txt")
+    if not os.path.exists(requirements_file):
+        return None
+    digest = hashlib.sha256()
+    with open(requirements_file, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _deps_cache_valid():
+    """Return True if the sentinel hash matches the current requirements.txt."""
+    current = _requirements_hash()
+    if current is None:
+        return False
+    try:
+        with open(_deps_sentinel_file()) as f:
+            return f.read().strip() == current
+    except OSError:
+        return False
+
+def _write_deps_sentinel():
+    """Record the current requirements.txt hash so future launches skip the check."""
+    current = _requirements_hash()
+    if current is None:
+        return
+    try:
+        with open(_deps_sentinel_file(), "w") as f:
+            f.write(current)
+    except OSError:
+        pass
+
+REQUIRED_DEPS = ("streamlit", "pandas", "plotly", "requests")
 
 def check_dependencies():
     """Check if required dependencies are installed"""
-    try:
-        import streamlit
-        import pandas
-        import plotly
-        import requests
+    # Warm path: anything already imported is trivially present.
+    if all(name in sys.modules for name in REQUIRED_DEPS):
         return True
-    except ImportError as e:
-        print(f"❌ Missing dependency: {e}")
-        return False
+
+    from importlib.metadata import distributions
+
+    # One scan of the installed-distribution index instead of a separate
+    # sys.path walk per dependency.
+    installed = {
+        name.lower() for d in distributions()
+        if (name := d.metadata["Name"]) is not None
+    }
+    missing = set(REQUIRED_DEPS) - installed
+    if missing:
+        # A distribution name can differ from its import name, so confirm
+        # with find_spec before reporting. The probes run in threads since
+        # the GIL is released during the underlying stat() calls.
+        import importlib.util
+        from concurrent.futures import ThreadPoolExecutor
+
+        names = sorted(missing)
+        with ThreadPoolExecutor(max_workers=len(names)) as ex:
+            specs = list(ex.map(importlib.util.find_spec, names))
+        missing = {name for name, spec in zip(names, specs) if spec is None}
+    for name in sorted(missing):
+        print(f"❌ Missing dependency: {name}")
+    return not missing
 
 def install_dependencies():
     """Install required dependencies"""
-    requirements_file = Path(__file__).parent / "requirements.txt"
-    
-    if not requirements_file.exists():
+    import subprocess
+
+    requirements_file = os.path.join(SCRIPT_DIR, "requirements.txt")
+
+    if not os.path.exists(requirements_file):
         print("❌ requirements.txt not found!")
         return False
-    
+
     print("📦 Installing dependencies...")
+    import re
+    import shutil
+
+    if shutil.which("uv"):
+        # uv keeps a content-addressed wheel cache, making repeat installs
+        # much faster than plain pip.
+        install_cmd = [
+            "uv", "pip", "install", "--python", sys.executable,
+            "-r", requirements_file
+        ]
+    else:
+        cache_dir = os.path.expanduser(os.path.join("~", ".cache", "tesla-tracker-pip"))
+        install_cmd = [
+            sys.executable, "-m", "pip", "install", "-r", requirements_file,
+            "--cache-dir", cache_dir
+        ]
+
+    # Stream the installer output, echoing only the lines worth seeing
+    # instead of inheriting stdio and replaying every progress line.
+    # Case-insensitive because pip says "ERROR:" where uv says "error:".
+    interesting = re.compile(r"^(successfully|error|warning)", re.IGNORECASE)
+    output = []
     try:
-        subprocess.check_call([
-            sys.executable, "-m", "pip", "install", "-r", str(requirements_file),
-            "--quiet"
-        ])
-        print("✅ Dependencies installed successfully!")
-        return True
-    except subprocess.CalledProcessError:
+        with subprocess.Popen(install_cmd, stdout=subprocess.PIPE,
+                              stderr=subprocess.STDOUT, text=True, bufsize=1) as p:
+            for line in p.stdout:
+                output.append(line)
+                if interesting.match(line):
+                    print(line, end='')
+        rc = p.returncode
+    except OSError:
+        rc = 1
+
+    if rc != 0:
+        # Replay the full installer output so the failure diagnostics
+        # aren't lost to the filter above.
+        print(''.join(output), end='')
         print("❌ Failed to install dependencies.")
         return False
+    print("✅ Dependencies installed successfully!")
+    return True
 
 def launch_app():
     """Launch the Streamlit web application"""
-    script_dir = Path(__file__).parent
-    os.chdir(script_dir)
-    
-    app_file = script_dir / "streamlit_app.py"
-    if not app_file.exists():
+    app_file = os.path.join(SCRIPT_DIR, "streamlit_app.py")
+    if not os.path.exists(app_file):
         print("❌ Streamlit app not found!")
         return False
     
@@ -65,54 +177,113 @@ def launch_app():
     print("🔴 Press Ctrl+C to stop the application")
     print("-" * 50)
     print()
-    
+
+    # The token/orders/history files and the option-codes glob all resolve
+    # against the working directory, so pin it to the repo directory before
+    # handing off to Streamlit — the exec'd (or spawned) child inherits it.
+    os.chdir(SCRIPT_DIR)
+
+
     try:
-        # Launch Streamlit with optimized settings
-        subprocess.run([
-            sys.executable, "-m", "streamlit", "run", "streamlit_app.py",
+        # Replace the launcher process with Streamlit so the Python
+        # interpreter running this script is freed for the whole session.
+        # The child must see the same sys.path as the dependency check —
+        # including user site-packages, where pip falls back to installing
+        # when system site-packages isn't writable — so no isolation flags.
+        # The file watcher burns idle CPU watching the script tree; only
+        # developers need hot-reload, so it is opt-in via TESLA_TRACKER_DEV=1.
+        dev_mode = os.environ.get("TESLA_TRACKER_DEV") == "1"
+        argv = [
+            sys.executable, "-m", "streamlit", "run", app_file,
             "--server.address", "localhost",
             "--server.port", "8501",
             "--server.headless", "false",
             "--browser.gatherUsageStats", "false",
-            "--server.runOnSave", "true",
+            "--server.fileWatcherType", "auto" if dev_mode else "none",
+            "--server.runOnSave", "true" if dev_mode else "false",
             "--server.allowRunOnSave", "true"
-        ])
-        return True
-    except KeyboardInterrupt:
-        print("\n🔴 Application stopped by user.")
-        return True
-    except Exception as e:
-        print(f"❌ Error launching application: {e}")
-        return False
+        ]
+        os.execvp(sys.executable, argv)
+    except OSError:
+        # exec failed; run Streamlit as a supervised child instead.
+        # posix_spawn avoids fork's page-table copy of the launcher process
+        # where available, with subprocess as the portable fallback.
+        try:
+            if hasattr(os, "posix_spawn"):
+                pid = os.posix_spawn(sys.executable, argv, os.environ)
+                os.waitpid(pid, 0)
+            else:
+                import subprocess
+
+                subprocess.run(argv)
+            return True
+        except KeyboardInterrupt:
+            print("\n🔴 Application stopped by user.")
+            return True
+        except OSError as e2:
+            print(f"❌ Error launching application: {e2}")
+            return False
+
+def _parse_args():
+    """Parse launcher arguments for non-interactive use."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Launch the Tesla Order Status Tracker web interface.")
+    parser.add_argument("-y", "--yes", action="store_true",
+                        help="Answer yes to all prompts (for systemd/Docker/CI use).")
+    parser.add_argument("--skip-check", action="store_true",
+                        help="Skip the dependency check entirely.")
+    return parser.parse_args()
+
+def _prewarm_imports():
+    """Pull the Streamlit child's heaviest modules into the OS page cache.
+
+    Runs in a daemon thread while the user reads the prompts; the launcher
+    execs into a fresh interpreter anyway, but touching every .pyc now means
+    the child finds them warm on disk.
+    """
+    for name in ("pandas", "pandas.io.formats.style", "plotly", "requests"):
+        try:
+            __import__(name)
+        except ImportError:
+            pass
 
 def main():
     """Main application entry point"""
+    args = _parse_args()
+
+    import threading
+    threading.Thread(target=_prewarm_imports, daemon=True).start()
+
     print_banner()
-    
-    print("Welcome to Tesla Order Status Tracker!")
-    print("This tool helps you monitor your Tesla order status and delivery updates")
-    print("through an easy-to-use web interface.\n")
-    
-    # Check dependencies
-    if not check_dependencies():
-        print("⚠️  Some dependencies are missing.")
-        install_choice = input("Would you like to install them now? (y/n): ").strip().lower()
-        
-        if install_choice == 'y':
-            if not install_dependencies():
-                print("❌ Failed to install dependencies. Please install manually:")
-                print("pip install -r requirements.txt")
-                return False
+
+    if _TTY:
+        sys.stdout.write(WELCOME_TEXT)
+
+    # Check dependencies (skipped when the sentinel matches requirements.txt)
+    if not args.skip_check and not _deps_cache_valid():
+        if check_dependencies():
+            _write_deps_sentinel()
         else:
-            print("❌ Cannot proceed without dependencies.")
-            return False
-    
+            print("⚠️  Some dependencies are missing.")
+            install_choice = 'y' if args.yes else _prompt(INSTALL_PROMPT)
+
+            if install_choice == 'y':
+                if not install_dependencies():
+                    print("❌ Failed to install dependencies. Please install manually:")
+                    print("pip install -r requirements.txt")
+                    return False
+                _write_deps_sentinel()
+            else:
+                print("❌ Cannot proceed without dependencies.")
+                return False
+
     print("✅ All dependencies are available!")
     print()
-    
+
     # Launch the application
-    proceed = input("🚀 Ready to launch Tesla Order Status Tracker? (y/n): ").strip().lower()
-    
+    proceed = 'y' if args.yes else _prompt(LAUNCH_PROMPT)
+
     if proceed == 'y':
         return launch_app()
     else:
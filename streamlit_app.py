@@ -14,24 +14,29 @@ import hashlib
 import requests
 import urllib.parse
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from typing import Dict, List, Optional, Any
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Import the original modules
+import tesla_order_status
 from tesla_order_status import (
     TOKEN_FILE, ORDERS_FILE, HISTORY_FILE, OPTION_CODES,
     load_tokens_from_file, save_tokens_to_file, is_token_valid, refresh_tokens,
-    retrieve_orders, get_order_details, save_orders_to_file, load_orders_from_file,
-    load_history_from_file, save_history_to_file, compare_orders, decode_option_codes,
+    retrieve_orders, get_order_details, migrate_history_format,
+    compare_orders, decode_option_codes,
     truncate_timestamp, generate_code_verifier_and_challenge, exchange_code_for_tokens,
     CLIENT_ID, REDIRECT_URI, AUTH_URL, TOKEN_URL, SCOPE, CODE_CHALLENGE_METHOD, APP_VERSION
 )
 from tesla_stores import TeslaStore
-from update_check import main as run_update_check
 
 # Page configuration
 st.set_page_config(
@@ -42,7 +47,7 @@ st.set_page_config(
 )
 
 # Custom CSS for better styling
-st.markdown("""
+_CSS = """
 <style>
     .main-header {
         text-align: center;
@@ -90,7 +95,25 @@ st.markdown("""
         font-size: 0.9rem;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# The stylesheet must be emitted on every run — Streamlit removes any
+# element a rerun does not re-produce, so a once-per-session gate would
+# strip the styling on the first interaction. The string itself is still
+# built only once, at import time.
+st.markdown(_CSS, unsafe_allow_html=True)
+
+@st.cache_resource
+def _http():
+    """Shared pooled HTTP session so parallel API calls reuse TLS connections."""
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=8))
+    return session
+
+# Route the shared helpers' API calls through the pooled session
+tesla_order_status.SESSION = _http()
 
 # Initialize session state
 if 'authenticated' not in st.session_state:
@@ -99,21 +122,125 @@ if 'access_token' not in st.session_state:
     st.session_state.access_token = None
 if 'orders_data' not in st.session_state:
     st.session_state.orders_data = None
+    st.session_state.orders_count = 0
 if 'last_update' not in st.session_state:
     st.session_state.last_update = None
 if 'show_sensitive_data' not in st.session_state:
     st.session_state.show_sensitive_data = True
 
+def _read_json_file(path: str):
+    """Parse a JSON file, using orjson's C parser when available."""
+    if HAS_ORJSON:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def _write_json_file(path: str, data) -> None:
+    """Serialize data to a JSON file, using orjson when available."""
+    if HAS_ORJSON:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f)
+
+@st.cache_data(ttl=60)
+def _cached_orders(mtime: float):
+    """Cache the parsed orders file, keyed on its mtime."""
+    if os.path.exists(ORDERS_FILE):
+        return _read_json_file(ORDERS_FILE)
+    return None
+
+@st.cache_data(ttl=60)
+def _cached_history(mtime: float):
+    """Cache the parsed history file, keyed on its mtime."""
+    if not os.path.exists(HISTORY_FILE):
+        return []
+    history = _read_json_file(HISTORY_FILE)
+    migrated = migrate_history_format(history)
+    if migrated != history:
+        _write_json_file(HISTORY_FILE, migrated)
+    return migrated
+
+def _file_mtime(path: str) -> float:
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return 0.0
+
+def _stat(path: str):
+    """Return (exists, size) with a single stat syscall."""
+    try:
+        return True, os.stat(path).st_size
+    except OSError:
+        return False, 0
+
+def cached_orders():
+    """Read the saved orders, hitting RAM instead of disk on reruns."""
+    return _cached_orders(_file_mtime(ORDERS_FILE))
+
+def cached_history():
+    """Read the change history, hitting RAM instead of disk on reruns."""
+    return _cached_history(_file_mtime(HISTORY_FILE))
+
+ORDERS_DIGEST_FILE = ORDERS_FILE + '.sha256'
+
+def _orders_digest(detailed_orders) -> str:
+    """Canonical sha256 over the orders payload, used to skip no-op diffs."""
+    if HAS_ORJSON:
+        payload = orjson.dumps(detailed_orders, option=orjson.OPT_SORT_KEYS)
+    else:
+        payload = json.dumps(detailed_orders, sort_keys=True, separators=(',', ':')).encode()
+    return hashlib.sha256(payload).hexdigest()
+
+def _saved_orders_digest() -> Optional[str]:
+    try:
+        with open(ORDERS_DIGEST_FILE) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+def save_orders(orders):
+    """Write the orders file (plus digest sidecar) and invalidate its read cache."""
+    _write_json_file(ORDERS_FILE, orders)
+    try:
+        with open(ORDERS_DIGEST_FILE, 'w') as f:
+            f.write(_orders_digest(orders))
+    except OSError:
+        pass
+    _cached_orders.clear()
+
+def save_history(history):
+    """Write the history file and invalidate its read cache."""
+    _write_json_file(HISTORY_FILE, history)
+    _cached_history.clear()
+
+@st.cache_data
+def _decode(mkt: str):
+    """Memoized option-code decode; keyed on the raw option string."""
+    return decode_option_codes(mkt)
+
+@st.cache_resource
+def _store(location):
+    """Resolve a routing location to its TeslaStore once per process."""
+    return TeslaStore(location)
+
+@st.cache_data(ttl=60)
+def _token_state(mtime: float):
+    """Cached token read + validity probe, keyed on the token file's mtime."""
+    tokens = load_tokens_from_file()
+    return is_token_valid(tokens['access_token']), tokens
+
 def check_existing_auth():
     """Check if there are existing valid tokens"""
     if os.path.exists(TOKEN_FILE):
         try:
-            tokens = load_tokens_from_file()
-            access_token = tokens['access_token']
-            
-            if is_token_valid(access_token):
+            valid, tokens = _token_state(_file_mtime(TOKEN_FILE))
+
+            if valid:
                 st.session_state.authenticated = True
-                st.session_state.access_token = access_token
+                st.session_state.access_token = tokens['access_token']
                 return True
             else:
                 # Try to refresh the token
@@ -121,6 +248,7 @@ def check_existing_auth():
                 try:
                     new_tokens = refresh_tokens(refresh_token)
                     save_tokens_to_file(new_tokens)
+                    _token_state.clear()
                     st.session_state.authenticated = True
                     st.session_state.access_token = new_tokens['access_token']
                     return True
@@ -244,23 +372,25 @@ def authenticate_user():
                     'code_verifier': st.session_state.code_verifier,
                 }
                 
-                response = requests.post(TOKEN_URL, data=token_data)
+                response = _http().post(TOKEN_URL, data=token_data)
                 response.raise_for_status()
                 tokens = response.json()
             
             # Save tokens and update session state
             save_tokens_to_file(tokens)
+            _token_state.clear()
             st.session_state.authenticated = True
             st.session_state.access_token = tokens['access_token']
             
-            st.success("🎉 Authentication successful! You can now view your Tesla order status.")
             st.balloons()  # Celebration animation
-            
+
             # Clear the redirect URL input
             if 'redirect_url_input' in st.session_state:
                 del st.session_state.redirect_url_input
-            
-            time.sleep(2)  # Brief pause to show success message
+
+            # A toast persists client-side across the rerun, so there is no
+            # need to block the server thread to show the success message.
+            st.toast("✅ Authentication successful!", icon="🎉")
             st.rerun()
             
         except requests.exceptions.HTTPError as e:
@@ -272,96 +402,144 @@ def authenticate_user():
     
     return st.session_state.authenticated
 
+class _EmptyOrderResponse(RuntimeError):
+    """Raised when the API returns an order without details.
+
+    Raising instead of returning a sentinel keeps the failure out of the
+    st.cache_data entry, so the next rerun retries immediately rather
+    than replaying a cached error for the full TTL.
+    """
+
+@st.cache_data(ttl=300, show_spinner="Fetching order information from Tesla...")
+def _fetch_detailed_orders(access_token: str, nonce: int):
+    """Fetch orders plus details from the Tesla API, cached for 5 minutes.
+
+    The nonce lets force-refresh bust the cache without clearing other
+    sessions' entries. Returns (detailed_orders, fetch_timestamp); the
+    timestamp identifies a fresh payload so callers only persist it once.
+    """
+    orders = retrieve_orders(access_token)
+
+    # Fetch the per-order details in parallel; the calls are pure
+    # I/O, so total latency is bounded by the slowest request
+    # instead of the sum of all round-trips. Worker exceptions propagate
+    # through ex.map so the caller still sees the real error (expired
+    # token, DNS failure, ...) rather than a generic empty-response one.
+    def _fetch_details(order):
+        return get_order_details(order['referenceNumber'], access_token)
+
+    with ThreadPoolExecutor(max_workers=min(8, max(1, len(orders)))) as ex:
+        all_details = list(ex.map(_fetch_details, orders))
+
+    detailed_orders = []
+    for order, order_details in zip(orders, all_details):
+        if not order_details or not order_details.get('tasks'):
+            raise _EmptyOrderResponse(order['referenceNumber'])
+
+        detailed_orders.append({
+            'order': order,
+            'details': order_details
+        })
+    return detailed_orders, time.time()
+
 def fetch_order_data(force_refresh=False):
     """Fetch order data from Tesla API"""
     if not st.session_state.authenticated:
         return None
-    
-    # Check if we have recent cached data
-    if (not force_refresh and 
-        st.session_state.orders_data and 
-        st.session_state.last_update and 
-        datetime.now() - st.session_state.last_update < timedelta(minutes=5)):
-        return st.session_state.orders_data
-    
+
+    if force_refresh:
+        st.session_state.refresh_nonce = st.session_state.get('refresh_nonce', 0) + 1
+
     try:
-        with st.spinner("Fetching order information from Tesla..."):
-            # Get orders
-            orders = retrieve_orders(st.session_state.access_token)
-            
-            # Get detailed information for each order
-            detailed_orders = []
-            for order in orders:
-                order_id = order['referenceNumber']
-                order_details = get_order_details(order_id, st.session_state.access_token)
-                
-                if not order_details or not order_details.get('tasks'):
-                    st.error("❌ Received empty response from Tesla API. Please try again later.")
-                    return None
-                
-                detailed_order = {
-                    'order': order,
-                    'details': order_details
-                }
-                detailed_orders.append(detailed_order)
-            
-            # Save to file and session state (respects auto-save setting)
-            if st.session_state.get('auto_save_orders', True):
-                save_orders_to_file(detailed_orders)
-            st.session_state.orders_data = detailed_orders
-            st.session_state.last_update = datetime.now()
-            
-            # Check for changes and update history
-            old_orders = load_orders_from_file()
-            if old_orders:
-                differences = compare_orders(old_orders, detailed_orders)
-                if differences:
-                    history = load_history_from_file()
-                    history.append({
-                        'timestamp': time.strftime('%Y-%m-%d'),
-                        'changes': differences
-                    })
-                    save_history_to_file(history)
-            
-            return detailed_orders
-            
+        detailed_orders, fetched_at = _fetch_detailed_orders(
+            st.session_state.access_token,
+            st.session_state.get('refresh_nonce', 0)
+        )
+    except _EmptyOrderResponse:
+        st.error("❌ Received empty response from Tesla API. Please try again later.")
+        return None
     except Exception as e:
         st.error(f"❌ Error fetching order data: {str(e)}")
         return None
 
+    # Persist and diff only when the payload actually came off the wire,
+    # not on every cache hit triggered by a rerun.
+    if st.session_state.get('processed_fetch') != fetched_at:
+        if st.session_state.get('auto_save_orders', True):
+            save_orders(detailed_orders)
+        st.session_state.last_update = datetime.now()
+        # Monotonic twin of last_update: immune to wall-clock jumps and
+        # cheap to turn into an elapsed-minutes int.
+        st.session_state.last_update_monotonic = time.monotonic()
+        st.session_state.processed_fetch = fetched_at
+
+        # Check for changes and update history. Compare digests first so
+        # the recursive diff only runs when the payload actually changed.
+        if _saved_orders_digest() != _orders_digest(detailed_orders):
+            old_orders = cached_orders()
+            differences = compare_orders(old_orders, detailed_orders) if old_orders else []
+            if differences:
+                history = cached_history()
+                history.append({
+                    'timestamp': time.strftime('%Y-%m-%d'),
+                    'changes': differences
+                })
+                save_history(history)
+
+    st.session_state.orders_data = detailed_orders
+    # Keep the count snapshotted beside the data so readers that only
+    # need it (Quick Stats) read a scalar instead of len() on the list.
+    st.session_state.orders_count = len(detailed_orders)
+    return detailed_orders
+
+@st.cache_data
+def _summary_rows(sig, _detailed_orders):
+    """Flatten the nested order payload into summary rows.
+
+    The payload itself is passed underscore-prefixed so Streamlit hashes
+    only the cheap fetch-identity signature instead of the whole tree.
+    """
+    return [
+        {
+            'model': o['order'].get('modelCode', 'N/A').upper(),
+            'status': o['order'].get('orderStatus', 'N/A'),
+            'vin': o['order'].get('vin', 'Not assigned'),
+            'window': o['details'].get('tasks', {}).get('scheduling', {}).get('deliveryWindowDisplay', 'TBD'),
+        }
+        for o in _detailed_orders
+    ]
+
 def display_order_summary(detailed_orders):
     """Display order summary cards"""
     if not detailed_orders:
         return
-    
+
     st.markdown("### 📊 Order Summary")
-    
-    for i, detailed_order in enumerate(detailed_orders):
-        order = detailed_order['order']
-        order_details = detailed_order['details']
-        scheduling = order_details.get('tasks', {}).get('scheduling', {})
-        registration_data = order_details.get('tasks', {}).get('registration', {})
-        order_info = registration_data.get('orderDetails', {})
-        
+
+    # Each fresh payload already gets a unique fetch timestamp
+    # (processed_fetch), so that plus the refresh nonce identifies the
+    # data without re-hashing the whole payload on every rerun.
+    sig = (st.session_state.get('refresh_nonce', 0), st.session_state.get('processed_fetch'))
+    rows = _summary_rows(sig, detailed_orders)
+    for row in rows:
         col1, col2, col3, col4 = st.columns(4)
-        
+
         with col1:
             st.metric(
                 label="Model",
-                value=order.get('modelCode', 'N/A').upper(),
+                value=row['model'],
                 help="Tesla model"
             )
-        
+
         with col2:
-            status = order.get('orderStatus', 'N/A')
             st.metric(
                 label="Status",
-                value=status,
+                value=row['status'],
                 help="Current order status"
             )
-        
+
         with col3:
-            vin = order.get('vin', 'Not assigned')
+            vin = row['vin']
             if not st.session_state.show_sensitive_data:
                 vin = "***HIDDEN***" if vin != 'Not assigned' else vin
             st.metric(
@@ -369,111 +547,160 @@ def display_order_summary(detailed_orders):
                 value=vin,
                 help="Vehicle Identification Number"
             )
-        
+
         with col4:
-            delivery_window = scheduling.get('deliveryWindowDisplay', 'TBD')
             st.metric(
                 label="Delivery Window",
-                value=delivery_window,
+                value=row['window'],
                 help="Estimated delivery timeframe"
             )
 
-def display_detailed_order_info(detailed_orders):
-    """Display detailed order information"""
-    if not detailed_orders:
-        return
-    
-    st.markdown("### 🚗 Detailed Order Information")
-    
-    for i, detailed_order in enumerate(detailed_orders):
-        order = detailed_order['order']
-        order_details = detailed_order['details']
-        scheduling = order_details.get('tasks', {}).get('scheduling', {})
-        registration_data = order_details.get('tasks', {}).get('registration', {})
-        order_info = registration_data.get('orderDetails', {})
-        final_payment_data = order_details.get('tasks', {}).get('finalPayment', {}).get('data', {})
+def _render_order(detailed_order):
+    """Render one order's expander; runs as an isolated fragment on
+    Streamlit >= 1.37 so UI toggles only re-render the affected order."""
+    order = detailed_order['order']
+    order_details = detailed_order['details']
+    scheduling = order_details.get('tasks', {}).get('scheduling', {})
+    registration_data = order_details.get('tasks', {}).get('registration', {})
+    order_info = registration_data.get('orderDetails', {})
+    final_payment_data = order_details.get('tasks', {}).get('finalPayment', {}).get('data', {})
+
+    with st.expander(f"Order Details - {order.get('modelCode', 'Unknown').upper()}", expanded=True):
+        # Basic order information
+        col1, col2 = st.columns(2)
         
-        with st.expander(f"Order Details - {order.get('modelCode', 'Unknown').upper()}", expanded=True):
-            # Basic order information
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.markdown("#### 📋 Order Details")
-                if st.session_state.show_sensitive_data:
-                    st.write(f"**Order ID:** {order['referenceNumber']}")
-                st.write(f"**Status:** {order['orderStatus']}")
-                st.write(f"**Model:** {order['modelCode']}")
-                
-                vin = order.get('vin', 'N/A')
-                if st.session_state.show_sensitive_data:
-                    st.write(f"**VIN:** {vin}")
-                else:
-                    st.write(f"**VIN:** {'***HIDDEN***' if vin != 'N/A' else 'Not assigned'}")
+        with col1:
+            st.markdown("#### 📋 Order Details")
+            if st.session_state.show_sensitive_data:
+                st.write(f"**Order ID:** {order['referenceNumber']}")
+            st.write(f"**Status:** {order['orderStatus']}")
+            st.write(f"**Model:** {order['modelCode']}")
             
-            with col2:
-                st.markdown("#### 📅 Timeline")
-                reservation_date = truncate_timestamp(order_info.get('reservationDate', 'N/A'))
-                order_booked_date = truncate_timestamp(order_info.get('orderBookedDate', 'N/A'))
-                st.write(f"**Reservation Date:** {reservation_date}")
-                st.write(f"**Order Booked Date:** {order_booked_date}")
-                
-                expected_reg_date = registration_data.get('expectedRegDate')
-                if expected_reg_date:
-                    st.write(f"**Expected Registration:** {truncate_timestamp(expected_reg_date)}")
+            vin = order.get('vin', 'N/A')
+            if st.session_state.show_sensitive_data:
+                st.write(f"**VIN:** {vin}")
+            else:
+                st.write(f"**VIN:** {'***HIDDEN***' if vin != 'N/A' else 'Not assigned'}")
+        
+        with col2:
+            st.markdown("#### 📅 Timeline")
+            reservation_date = truncate_timestamp(order_info.get('reservationDate', 'N/A'))
+            order_booked_date = truncate_timestamp(order_info.get('orderBookedDate', 'N/A'))
+            st.write(f"**Reservation Date:** {reservation_date}")
+            st.write(f"**Order Booked Date:** {order_booked_date}")
             
-            # Configuration options
-            st.markdown("#### ⚙️ Configuration Options")
-            decoded_options = decode_option_codes(order.get('mktOptions', ''))
-            if decoded_options:
-                option_cols = st.columns(2)
-                for idx, (code, description) in enumerate(decoded_options):
-                    col_idx = idx % 2
-                    with option_cols[col_idx]:
-                        st.markdown(f'<span class="option-code">{code}</span> {description}', 
-                                  unsafe_allow_html=True)
+            expected_reg_date = registration_data.get('expectedRegDate')
+            if expected_reg_date:
+                st.write(f"**Expected Registration:** {truncate_timestamp(expected_reg_date)}")
+        
+        # Configuration options
+        st.markdown("#### ⚙️ Configuration Options")
+        decoded_options = _decode(order.get('mktOptions', ''))
+        if decoded_options:
+            option_cols = st.columns(2)
+            for idx, (code, description) in enumerate(decoded_options):
+                col_idx = idx % 2
+                with option_cols[col_idx]:
+                    st.markdown(f'<span class="option-code">{code}</span> {description}', 
+                              unsafe_allow_html=True)
+        
+        # Delivery information
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("#### 🚚 Delivery Information")
+            routing_location = order_info.get('vehicleRoutingLocation', 'N/A')
+            tesla_store = _store(routing_location)
+            st.write(f"**Routing Location:** {routing_location} ({tesla_store.label})")
+            st.write(f"**Delivery Center:** {scheduling.get('deliveryAddressTitle', 'N/A')}")
+            st.write(f"**Delivery Window:** {scheduling.get('deliveryWindowDisplay', 'N/A')}")
             
-            # Delivery information
-            col1, col2 = st.columns(2)
+            eta = final_payment_data.get('etaToDeliveryCenter', 'N/A')
+            if eta != 'N/A':
+                st.write(f"**ETA to Delivery Center:** {eta}")
             
-            with col1:
-                st.markdown("#### 🚚 Delivery Information")
-                routing_location = order_info.get('vehicleRoutingLocation', 'N/A')
-                tesla_store = TeslaStore(routing_location)
-                st.write(f"**Routing Location:** {routing_location} ({tesla_store.label})")
-                st.write(f"**Delivery Center:** {scheduling.get('deliveryAddressTitle', 'N/A')}")
-                st.write(f"**Delivery Window:** {scheduling.get('deliveryWindowDisplay', 'N/A')}")
-                
-                eta = final_payment_data.get('etaToDeliveryCenter', 'N/A')
-                if eta != 'N/A':
-                    st.write(f"**ETA to Delivery Center:** {eta}")
-                
-                appointment = scheduling.get('apptDateTimeAddressStr', 'N/A')
-                if appointment != 'N/A':
-                    st.write(f"**Delivery Appointment:** {appointment}")
+            appointment = scheduling.get('apptDateTimeAddressStr', 'N/A')
+            if appointment != 'N/A':
+                st.write(f"**Delivery Appointment:** {appointment}")
+        
+        with col2:
+            st.markdown("#### 🔧 Vehicle Status")
+            odometer = order_info.get('vehicleOdometer', 'N/A')
+            odometer_type = order_info.get('vehicleOdometerType', '')
+            st.write(f"**Vehicle Odometer:** {odometer} {odometer_type}")
             
-            with col2:
-                st.markdown("#### 🔧 Vehicle Status")
-                odometer = order_info.get('vehicleOdometer', 'N/A')
-                odometer_type = order_info.get('vehicleOdometerType', '')
-                st.write(f"**Vehicle Odometer:** {odometer} {odometer_type}")
+            # Financing information
+            financing_details = final_payment_data.get('financingDetails') or {}
+            if financing_details:
+                st.markdown("#### 💰 Financing Information")
+                finance_partner = financing_details.get('teslaFinanceDetails', {}).get('financePartnerName', 'N/A')
+                if finance_partner != 'N/A':
+                    st.write(f"**Finance Partner:** {finance_partner}")
                 
-                # Financing information
-                financing_details = final_payment_data.get('financingDetails') or {}
-                if financing_details:
-                    st.markdown("#### 💰 Financing Information")
-                    finance_partner = financing_details.get('teslaFinanceDetails', {}).get('financePartnerName', 'N/A')
-                    if finance_partner != 'N/A':
-                        st.write(f"**Finance Partner:** {finance_partner}")
-                    
-                    order_type = financing_details.get('orderType', 'N/A')
-                    if order_type != 'N/A':
-                        st.write(f"**Payment Type:** {order_type}")
+                order_type = financing_details.get('orderType', 'N/A')
+                if order_type != 'N/A':
+                    st.write(f"**Payment Type:** {order_type}")
+
+if hasattr(st, "fragment"):
+    _render_order = st.fragment(_render_order)
+
+def display_detailed_order_info(detailed_orders):
+    """Display detailed order information"""
+    if not detailed_orders:
+        return
+
+    st.markdown("### 🚗 Detailed Order Information")
+
+    for detailed_order in detailed_orders:
+        _render_order(detailed_order)
+
+
+@st.cache_resource
+def _timeline_fig(sig):
+    """Build the changes-over-time line chart, cached per history signature."""
+    import pandas as pd
+    import plotly.express as px
+
+    history = cached_history()
+    if not history:
+        return None
+    # Create timeline chart: one columnar construction with a
+    # vectorized date parse instead of an append loop.
+    df = pd.DataFrame({
+        'date': pd.to_datetime([entry['timestamp'] for entry in history]),
+        'changes': [len(entry['changes']) for entry in history]
+    })
+    fig = px.line(df, x='date', y='changes',
+                title='Order Changes Over Time',
+                labels={'changes': 'Number of Changes', 'date': 'Date'})
+    fig.update_traces(mode='markers+lines')
+    return fig
+
+@st.cache_resource
+def _change_types_fig(sig):
+    """Build the change-type distribution pie chart, cached per history signature."""
+    import plotly.express as px
+
+    history = cached_history()
+    # Change type distribution, aggregated in one C-level pass
+    counts = Counter(
+        change.get('operation', 'unknown')
+        for entry in history for change in entry['changes']
+    )
+    change_types = {op: counts.get(op, 0) for op in ('added', 'removed', 'changed')}
+    if not any(change_types.values()):
+        return None
+    return px.pie(values=list(change_types.values()),
+                  names=list(change_types.keys()),
+                  title='Change Types Distribution')
 
 def display_change_history():
     """Display order change history with visualizations"""
+    import pandas as pd
+
     st.markdown("### 📈 Change History")
     
-    history = load_history_from_file()
+    history = cached_history()
     if not history:
         st.info("No change history available yet. Changes will appear here after your first update.")
         return
@@ -483,9 +710,11 @@ def display_change_history():
     
     with tab1:
         st.markdown("#### Recent Changes (Last 30 days)")
-        recent_changes = [entry for entry in history 
-                         if datetime.strptime(entry['timestamp'], '%Y-%m-%d') > 
-                         datetime.now() - timedelta(days=30)]
+        # Hoist the cutoff and parse all timestamps in one vectorized call
+        # instead of a strptime per entry.
+        cutoff = datetime.now() - timedelta(days=30)
+        timestamps = pd.to_datetime([entry['timestamp'] for entry in history])
+        recent_changes = [entry for entry, ts in zip(history, timestamps) if ts > cutoff]
         
         if recent_changes:
             for entry in reversed(recent_changes[-10:]):  # Show last 10 changes
@@ -505,35 +734,16 @@ def display_change_history():
     
     with tab2:
         if history:
-            # Create timeline chart
-            df_changes = []
-            for entry in history:
-                date = entry['timestamp']
-                change_count = len(entry['changes'])
-                df_changes.append({'date': date, 'changes': change_count})
-            
-            if df_changes:
-                df = pd.DataFrame(df_changes)
-                df['date'] = pd.to_datetime(df['date'])
-                
-                fig = px.line(df, x='date', y='changes', 
-                            title='Order Changes Over Time',
-                            labels={'changes': 'Number of Changes', 'date': 'Date'})
-                fig.update_traces(mode='markers+lines')
+            # Figures are cached on a cheap signature so tab switches and
+            # sidebar clicks reuse the built Plotly objects.
+            sig = (len(history), history[-1]['timestamp'])
+
+            fig = _timeline_fig(sig)
+            if fig is not None:
                 st.plotly_chart(fig, use_container_width=True)
-            
-            # Change type distribution
-            change_types = {'added': 0, 'removed': 0, 'changed': 0}
-            for entry in history:
-                for change in entry['changes']:
-                    operation = change.get('operation', 'unknown')
-                    if operation in change_types:
-                        change_types[operation] += 1
-            
-            if any(change_types.values()):
-                fig_pie = px.pie(values=list(change_types.values()), 
-                               names=list(change_types.keys()),
-                               title='Change Types Distribution')
+
+            fig_pie = _change_types_fig(sig)
+            if fig_pie is not None:
                 st.plotly_chart(fig_pie, use_container_width=True)
     
     with tab3:
@@ -555,6 +765,8 @@ def display_change_history():
 
 def display_configuration_options():
     """Display configuration and options management"""
+    import pandas as pd
+
     st.markdown("### ⚙️ Configuration & Options")
     
     col1, col2 = st.columns(2)
@@ -583,6 +795,7 @@ def display_configuration_options():
         if st.button("🗑️ Clear Authentication"):
             if os.path.exists(TOKEN_FILE):
                 os.remove(TOKEN_FILE)
+                _token_state.clear()
             st.session_state.authenticated = False
             st.session_state.access_token = None
             st.success("Authentication cleared. Please refresh the page.")
@@ -592,13 +805,18 @@ def display_configuration_options():
         
         if st.button("🔄 Force Refresh Data"):
             st.session_state.orders_data = None
+            st.session_state.orders_count = 0
             st.session_state.last_update = None
+            st.session_state.last_update_monotonic = None
+            # Bump the nonce so the next fetch misses the TTL cache and
+            # actually hits the API, same as the sidebar Quick Refresh.
+            st.session_state.refresh_nonce = st.session_state.get('refresh_nonce', 0) + 1
             st.success("Data refresh forced. Navigate to 'Order Status' to reload.")
         
         # Manual save button when auto-save is disabled
         if not st.session_state.get('auto_save_orders', True) and st.session_state.orders_data:
             if st.button("💾 Save Order Data"):
-                save_orders_to_file(st.session_state.orders_data)
+                save_orders(st.session_state.orders_data)
                 st.success("Order data saved manually!")
         
         # File information
@@ -608,12 +826,18 @@ def display_configuration_options():
             ("Orders", ORDERS_FILE),
             ("History", HISTORY_FILE)
         ]:
-            exists = os.path.exists(file_path)
-            size = os.path.getsize(file_path) if exists else 0
+            exists, size = _stat(file_path)
             files_info.append({"File": file_name, "Exists": "✅" if exists else "❌", "Size (KB)": f"{size/1024:.1f}"})
         
         st.dataframe(pd.DataFrame(files_info), use_container_width=True)
 
+@st.cache_data
+def _codes_df():
+    """Build the option-codes DataFrame once per process."""
+    import pandas as pd
+
+    return pd.DataFrame(OPTION_CODES.items(), columns=['Code', 'Description'])
+
 def display_option_codes_reference():
     """Display option codes reference"""
     st.markdown("### 📚 Tesla Option Codes Reference")
@@ -622,9 +846,12 @@ def display_option_codes_reference():
         st.error("Option codes not loaded.")
         return
     
-    # Search functionality
-    search_term = st.text_input("🔍 Search option codes:", placeholder="Enter code or description...")
-    
+    # Search functionality behind a form so typing doesn't trigger a full
+    # rerun per keystroke; the filter only runs on Enter/submit.
+    with st.form("codes_search", clear_on_submit=False):
+        search_term = st.text_input("🔍 Search option codes:", placeholder="Enter code or description...")
+        st.form_submit_button("Search")
+
     # Filter options
     col1, col2 = st.columns(2)
     with col1:
@@ -632,32 +859,265 @@ def display_option_codes_reference():
     with col2:
         codes_per_page = st.selectbox("Codes per page", [50, 100, 200, 500], index=1)
     
-    # Filter and display codes
-    filtered_codes = OPTION_CODES
-    
+    # Filter with vectorized string matching over the cached DataFrame
+    # instead of lowercasing every code/description in a Python loop.
+    df = _codes_df()
     if search_term:
-        filtered_codes = {
-            code: desc for code, desc in OPTION_CODES.items()
-            if search_term.lower() in code.lower() or search_term.lower() in desc.lower()
-        }
-    
-    if filtered_codes:
-        # Convert to DataFrame for better display
-        df_codes = pd.DataFrame([
-            {"Code": code, "Description": desc} 
-            for code, desc in list(filtered_codes.items())[:codes_per_page if not show_all else None]
-        ])
-        
+        mask = (df['Code'].str.contains(search_term, case=False, regex=False)
+                | df['Description'].str.contains(search_term, case=False, regex=False))
+        filtered = df[mask]
+    else:
+        filtered = df
+
+    if not filtered.empty:
+        # Hard-cap what goes through Arrow serialization to the browser;
+        # the full list is available as a CSV download instead.
+        row_cap = min(2000 if show_all else codes_per_page, len(filtered))
+        df_codes = filtered.head(row_cap)
+
         st.dataframe(
             df_codes,
             use_container_width=True,
             height=400 if not show_all else None
         )
-        
-        st.info(f"Showing {len(df_codes)} of {len(filtered_codes)} matching codes ({len(OPTION_CODES)} total)")
+
+        st.info(f"Showing {len(df_codes)} of {len(filtered)} matching codes ({len(OPTION_CODES)} total)")
+        if len(filtered) > row_cap:
+            st.download_button(
+                "⬇️ Download all matching codes",
+                filtered.to_csv(index=False),
+                "option_codes.csv",
+                mime="text/csv"
+            )
     else:
         st.warning("No option codes found matching your search.")
 
+# Short status strings are interned so every rebuild of the status table
+# reuses the same objects, and the component names live in one tuple.
+_OK = sys.intern("✅ OK")
+_CONN = sys.intern("✅ Connected")
+_STATUS_COMPONENTS = ("Python", "Streamlit", "Tesla API", "Local Storage")
+
+# Static About copy as module constants: one allocation per process, and
+# st.markdown/st.info receive the same object every rerun.
+_ABOUT_MD_LEFT = """
+    This web interface provides a user-friendly way to track your Tesla order status.
+
+    **🌟 Key Features:**
+    - 🔐 Secure Tesla authentication (OAuth2)
+    - 📊 Real-time order status tracking
+    - 📈 Interactive change history visualization
+    - 🔍 Comprehensive Tesla option code reference
+    - 💾 Local data caching for privacy
+    - 🔒 Privacy controls for sharing screenshots
+    - 🎨 Modern, responsive web interface
+
+    **🙏 Credits:**
+    - Original CLI script: [niklaswa](https://github.com/niklaswa/tesla-order-status)
+    - Enhanced version: [MarcDGit](https://github.com/MarcDGit/tesla-order-status)
+    - Streamlit web interface: This application
+    """
+
+_ABOUT_MD_RIGHT = """
+    **🔒 Security & Privacy:**
+
+    - All authentication happens directly with Tesla
+    - Your credentials are never stored or shared
+    - Data stays on your local machine
+    - Open source and transparent
+    """
+
+# Miss counters for the About-page caches: each cached helper bumps its
+# entry only when its body actually runs, so low numbers mean the caches
+# are doing their job. Surfaced in the TESLA_DEBUG expander below.
+# Held in a cache_resource singleton because Streamlit re-executes this
+# module on every rerun — a plain module global would be reset each time.
+@st.cache_resource
+def _cache_miss_counter() -> Counter:
+    return Counter()
+
+_CACHE_MISSES = _cache_miss_counter()
+
+@st.cache_data(ttl=5)
+def _present_files(parent: str, names: tuple) -> int:
+    """Count how many of `names` exist in `parent` with one directory scan."""
+    _CACHE_MISSES["_present_files"] += 1
+    try:
+        with os.scandir(parent) as it:
+            present = {entry.name for entry in it}
+    except OSError:
+        return 0
+    return sum(name in present for name in names)
+
+@st.cache_data(ttl=60)
+def _status_table_md(files_present: int) -> str:
+    """Pre-render the system-status table as markdown.
+
+    Four rows of strings don't need pandas, Arrow serialization, or the
+    interactive grid component — a cached markdown string keeps pandas
+    off this page entirely.
+    """
+    _CACHE_MISSES["_status_table_md"] += 1
+    statuses = (_OK, _OK, _CONN, _OK)
+    details = (
+        f"Version {sys.version.split()[0]}",
+        f"Version {st.__version__}",
+        "Authenticated and ready",
+        f"Files: {files_present}/3",
+    )
+    rows = "\n".join(
+        f"| {component} | {status} | {detail} |"
+        for component, status, detail in zip(_STATUS_COMPONENTS, statuses, details)
+    )
+    return "| Component | Status | Details |\n|---|---|---|\n" + rows
+
+def _render_quick_status():
+    """Render the 'time since update' sidebar line."""
+    if st.session_state.last_update:
+        time_since = datetime.now() - st.session_state.last_update
+        minutes_ago = time_since.seconds // 60
+        if minutes_ago == 0:
+            st.sidebar.success("✅ Just updated!")
+        else:
+            st.sidebar.success(f"✅ Updated {minutes_ago}m ago")
+    else:
+        st.sidebar.warning("⏳ No recent data")
+
+# On Streamlit >= 1.37 the status line ticks as an isolated fragment every
+# 30s instead of re-running the whole page just to refresh a label.
+if hasattr(st, "fragment"):
+    _render_quick_status = st.fragment(run_every="30s")(_render_quick_status)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_update_check(version_key: str) -> int:
+    """Run the update check at most once per hour for a given version."""
+    _CACHE_MISSES["_cached_update_check"] += 1
+    # Imported here so sessions that never click the button don't load
+    # the update-check module (and its network stack) at startup.
+    from update_check import main as run_update_check
+
+    return run_update_check()
+
+def _render_update_check():
+    """Render the update-check section of the About page."""
+    st.markdown("---")
+    st.markdown("### 🔄 Updates")
+    if st.button("Check for Updates", type="secondary"):
+        with st.spinner("Checking for updates..."):
+            try:
+                result = _cached_update_check(APP_VERSION)
+                if result == 0:
+                    st.success("✅ You have the latest version!")
+                elif result == 1:
+                    st.warning("⚠️ Update available! Check the GitHub repository.")
+                else:
+                    st.error("❌ Error checking for updates.")
+            except Exception as e:
+                st.error(f"❌ Update check failed: {str(e)}")
+
+@st.cache_data(ttl=30)
+def _history_len(mtime: float) -> int:
+    """Memoized history length.
+
+    Reading the int out of this cache is free; pulling the whole history
+    list out of its cache copies it on every access, which is wasteful
+    when only the count is needed.
+    """
+    _CACHE_MISSES["_history_len"] += 1
+    return len(cached_history())
+
+_QUICK_STAT_LABELS = ("Total Orders", "History Entries", "Minutes Since Update")
+
+def _render_quick_stats():
+    """Render the Quick Stats metrics on the About page."""
+    if st.session_state.get("orders_count", 0):
+        st.markdown("---")
+        st.markdown("### 📊 Quick Stats")
+        started = st.session_state.get("last_update_monotonic")
+        # Plain float subtraction instead of a datetime/timedelta
+        # round-trip, and correct past the 24h mark where
+        # timedelta.seconds wraps.
+        values = (
+            st.session_state.orders_count,
+            _history_len(_file_mtime(HISTORY_FILE)),
+            int((time.monotonic() - started) // 60) if started is not None else None,
+        )
+        for column, label, value in zip(st.columns(3), _QUICK_STAT_LABELS, values):
+            if value is not None:
+                column.metric(label, value)
+
+def _render_about_page():
+    """Render the About page."""
+    st.markdown("### ℹ️ About Tesla Order Status Tracker")
+
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        st.markdown(_ABOUT_MD_LEFT)
+
+    with col2:
+        st.info(_ABOUT_MD_RIGHT)
+
+    # System status
+    st.markdown("---")
+    st.markdown("### 🖥️ System Status")
+
+    # The data files all live in the working directory, so one scandir
+    # replaces three separate stat() calls. A 2s session-state gate in
+    # front of it lets rapid widget-driven reruns reuse the last count
+    # without even touching the cache's key-hashing machinery.
+    now = time.monotonic()
+    cached = st.session_state.get("_files_present")
+    if cached is None or now - cached[1] > 2.0:
+        cached = (_present_files(".", (TOKEN_FILE, ORDERS_FILE, HISTORY_FILE)), now)
+        st.session_state["_files_present"] = cached
+    files_present = cached[0]
+    st.markdown(_status_table_md(files_present))
+
+    if os.environ.get("TESLA_DEBUG"):
+        with st.expander("Cache stats"):
+            # get_stats is a newer Streamlit API; fall back to the manual
+            # miss counters when it is not available.
+            if hasattr(st.cache_data, "get_stats"):
+                st.write(st.cache_data.get_stats())
+            else:
+                st.write(dict(_CACHE_MISSES))
+
+    _render_update_check()
+    _render_quick_stats()
+
+# Same fragment treatment as the sidebar status line: clicking the update
+# button or ticking the stats re-runs only that section, not the whole page.
+if hasattr(st, "fragment"):
+    _render_update_check = st.fragment(_render_update_check)
+    _render_quick_stats = st.fragment(run_every="30s")(_render_quick_stats)
+    _render_about_page = st.fragment(_render_about_page)
+
+def _render_order_status_page():
+    """Render the Order Status page."""
+    # Fetch and display order data
+    orders_data = fetch_order_data()
+
+    if orders_data:
+        display_order_summary(orders_data)
+        st.markdown("---")
+        display_detailed_order_info(orders_data)
+    else:
+        st.error("❌ Unable to fetch order data. Please check your authentication and try again.")
+        if st.button("🔄 Try Again", type="primary"):
+            st.rerun()
+
+# Dispatch table for the sidebar selectbox: one dict lookup instead of a
+# chain of string comparisons. Built after the fragment wrapping above so
+# the About entry binds the wrapped function.
+PAGES = {
+    "📊 Order Status": _render_order_status_page,
+    "📈 Change History": display_change_history,
+    "⚙️ Configuration": display_configuration_options,
+    "📚 Option Codes": display_option_codes_reference,
+    "ℹ️ About": _render_about_page,
+}
+
 def main():
     """Main Streamlit application"""
     
@@ -686,8 +1146,7 @@ def main():
         
         # Show authentication interface directly for new users
         if authenticate_user():
-            st.success("🎉 Welcome! You're now authenticated and ready to track your Tesla order.")
-            time.sleep(2)
+            st.toast("🎉 Welcome! You're now authenticated and ready to track your Tesla order.")
             st.rerun()
         return
     
@@ -695,23 +1154,15 @@ def main():
     st.sidebar.markdown("## 🧭 Navigation")
     page = st.sidebar.selectbox(
         "Choose a page:",
-        ["📊 Order Status", "📈 Change History", "⚙️ Configuration", "📚 Option Codes", "ℹ️ About"],
+        list(PAGES),
         index=0  # Default to Order Status
     )
     
     # Quick status in sidebar
     st.sidebar.markdown("---")
     st.sidebar.markdown("## 🔍 Quick Status")
-    
-    if st.session_state.last_update:
-        time_since = datetime.now() - st.session_state.last_update
-        minutes_ago = time_since.seconds // 60
-        if minutes_ago == 0:
-            st.sidebar.success("✅ Just updated!")
-        else:
-            st.sidebar.success(f"✅ Updated {minutes_ago}m ago")
-    else:
-        st.sidebar.warning("⏳ No recent data")
+
+    _render_quick_status()
     
     if st.sidebar.button("🔄 Quick Refresh", use_container_width=True):
         with st.spinner("Refreshing order data..."):
@@ -728,119 +1179,19 @@ def main():
         # Clear authentication
         if os.path.exists(TOKEN_FILE):
             os.remove(TOKEN_FILE)
+            _token_state.clear()
         st.session_state.authenticated = False
         st.session_state.access_token = None
         st.session_state.orders_data = None
+        st.session_state.orders_count = 0
         st.session_state.last_update = None
+        st.session_state.last_update_monotonic = None
         st.success("👋 Signed out successfully!")
         time.sleep(1)
         st.rerun()
     
     # Main content based on selected page
-    if page == "📊 Order Status":
-        # Fetch and display order data
-        orders_data = fetch_order_data()
-        
-        if orders_data:
-            display_order_summary(orders_data)
-            st.markdown("---")
-            display_detailed_order_info(orders_data)
-        else:
-            st.error("❌ Unable to fetch order data. Please check your authentication and try again.")
-            if st.button("🔄 Try Again", type="primary"):
-                st.rerun()
-    
-    elif page == "📈 Change History":
-        display_change_history()
-    
-    elif page == "⚙️ Configuration":
-        display_configuration_options()
-    
-    elif page == "📚 Option Codes":
-        display_option_codes_reference()
-    
-    elif page == "ℹ️ About":
-        st.markdown("### ℹ️ About Tesla Order Status Tracker")
-        
-        col1, col2 = st.columns([2, 1])
-        
-        with col1:
-            st.markdown("""
-            This web interface provides a user-friendly way to track your Tesla order status.
-            
-            **🌟 Key Features:**
-            - 🔐 Secure Tesla authentication (OAuth2)
-            - 📊 Real-time order status tracking
-            - 📈 Interactive change history visualization
-            - 🔍 Comprehensive Tesla option code reference
-            - 💾 Local data caching for privacy
-            - 🔒 Privacy controls for sharing screenshots
-            - 🎨 Modern, responsive web interface
-            
-            **🙏 Credits:**
-            - Original CLI script: [niklaswa](https://github.com/niklaswa/tesla-order-status)
-            - Enhanced version: [MarcDGit](https://github.com/MarcDGit/tesla-order-status)
-            - Streamlit web interface: This application
-            """)
-        
-        with col2:
-            st.info("""
-            **🔒 Security & Privacy:**
-            
-            - All authentication happens directly with Tesla
-            - Your credentials are never stored or shared
-            - Data stays on your local machine
-            - Open source and transparent
-            """)
-        
-        # System status
-        st.markdown("---")
-        st.markdown("### 🖥️ System Status")
-        
-        status_data = {
-            "Component": ["Python", "Streamlit", "Tesla API", "Local Storage"],
-            "Status": ["✅ OK", "✅ OK", "✅ Connected", "✅ OK"],
-            "Details": [
-                f"Version {sys.version.split()[0]}",
-                f"Version {st.__version__}",
-                "Authenticated and ready",
-                f"Files: {sum(1 for f in [TOKEN_FILE, ORDERS_FILE, HISTORY_FILE] if os.path.exists(f))}/3"
-            ]
-        }
-        
-        st.dataframe(pd.DataFrame(status_data), use_container_width=True)
-        
-        # Update check
-        st.markdown("---")
-        st.markdown("### 🔄 Updates")
-        if st.button("Check for Updates", type="secondary"):
-            with st.spinner("Checking for updates..."):
-                try:
-                    result = run_update_check()
-                    if result == 0:
-                        st.success("✅ You have the latest version!")
-                    elif result == 1:
-                        st.warning("⚠️ Update available! Check the GitHub repository.")
-                    else:
-                        st.error("❌ Error checking for updates.")
-                except Exception as e:
-                    st.error(f"❌ Update check failed: {str(e)}")
-        
-        # Quick stats
-        if st.session_state.orders_data:
-            st.markdown("---")
-            st.markdown("### 📊 Quick Stats")
-            total_orders = len(st.session_state.orders_data)
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Total Orders", total_orders)
-            with col2:
-                history = load_history_from_file()
-                st.metric("History Entries", len(history))
-            with col3:
-                if st.session_state.last_update:
-                    time_since = datetime.now() - st.session_state.last_update
-                    st.metric("Minutes Since Update", time_since.seconds // 60)
+    PAGES[page]()
 
 if __name__ == "__main__":
     main()
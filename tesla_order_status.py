@@ -37,6 +37,9 @@ ORDERS_FILE = 'tesla_orders.json'
 HISTORY_FILE = 'tesla_order_history.json'
 APP_VERSION = '9.99.9-9999' # we can use a dummy version here, as the API does not check it strictly
 
+# Shared session so consecutive API calls reuse the TCP+TLS connection
+SESSION = requests.Session()
+
 OPTION_CODES = {}
 for path in sorted(glob("./option-codes/*.json")):
     with open(path, encoding="utf-8") as f:
@@ -125,7 +128,7 @@ def exchange_code_for_tokens(auth_code):
         'redirect_uri': REDIRECT_URI,
         'code_verifier': code_verifier,
     }
-    response = requests.post(TOKEN_URL, data=token_data)
+    response = SESSION.post(TOKEN_URL, data=token_data)
     response.raise_for_status()
     return response.json()
 
@@ -153,7 +156,7 @@ def refresh_tokens(refresh_token):
         'client_id': CLIENT_ID,
         'refresh_token': refresh_token,
     }
-    response = requests.post(TOKEN_URL, data=token_data)
+    response = SESSION.post(TOKEN_URL, data=token_data)
     response.raise_for_status()
     return response.json()
 
@@ -161,7 +164,7 @@ def refresh_tokens(refresh_token):
 def retrieve_orders(access_token):
     headers = {'Authorization': f'Bearer {access_token}'}
     api_url = 'https://owner-api.teslamotors.com/api/1/users/orders'
-    response = requests.get(api_url, headers=headers)
+    response = SESSION.get(api_url, headers=headers)
     response.raise_for_status()
     return response.json()['response']
 
@@ -169,7 +172,7 @@ def retrieve_orders(access_token):
 def get_order_details(order_id, access_token):
     headers = {'Authorization': f'Bearer {access_token}'}
     api_url = f'https://akamai-apigateway-vfx.tesla.com/tasks?deviceLanguage=en&deviceCountry=DE&referenceNumber={order_id}&appVersion={APP_VERSION}'
-    response = requests.get(api_url, headers=headers)
+    response = SESSION.get(api_url, headers=headers)
     response.raise_for_status()
     return response.json()
 